@@ -1,18 +1,42 @@
 #! /usr/bin/env uv run python3
 
-from jira import JIRA
+import json
+import os
+import time
+from typing import Optional
 
-from shared import load_config, validate_jira_base_config
+from shared import CACHE_DIR, get_jira, load_config, validate_jira_base_config
+
+FIELDS_CACHE_FILE = os.path.join(CACHE_DIR, "jira_fields.json")
+FIELDS_CACHE_TTL = 24 * 60 * 60  # field definitions rarely change
+
+
+def load_cached_fields(url: str) -> Optional[list[dict]]:
+    try:
+        with open(FIELDS_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if data.get("url") != url or time.time() - data.get("ts", 0) >= FIELDS_CACHE_TTL:
+        return None
+    return data.get("fields")
+
+
+def save_cached_fields(url: str, fields: list[dict]) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(FIELDS_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "ts": time.time(), "fields": fields}, f)
 
 
 def main() -> None:
     config = load_config()
     validate_jira_base_config(config)
 
-    jira = JIRA(server=config.jira.url, token_auth=config.jira.token)
-
-    print("Fetching Jira fields...")
-    fields = jira.fields()
+    fields = load_cached_fields(config.jira.url)
+    if fields is None:
+        print("Fetching Jira fields...")
+        fields = get_jira(config).fields()
+        save_cached_fields(config.jira.url, fields)
 
     sp_fields = [f for f in fields if "Story Point" in f["name"]]
     sprint_fields = [f for f in fields if "Sprint" in f["name"]]
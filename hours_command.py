@@ -1,69 +1,86 @@
 #! /usr/bin/env uv run python3
-import os
+import json
 from datetime import date, timedelta
 
 import yaml
 
-from shared import load_ticket_from_cache
+from shared import (
+    SafeLoader,
+    load_ticket_from_cache,
+    load_tickets_from_cache,
+)
 
-HOURS_FILE = "hours.yaml"
+HOURS_FILE = "hours.json"
+LEGACY_HOURS_FILE = "hours.yaml"
 
 
 def load_hours():
-    if not os.path.exists(HOURS_FILE):
+    try:
+        with open(HOURS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+    # Hours used to be stored as YAML, keep reading it until the next save
+    try:
+        with open(LEGACY_HOURS_FILE, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+    except FileNotFoundError:
         return {}
-    with open(HOURS_FILE, "r") as f:
-        return yaml.safe_load(f) or {}
 
 
 def save_hours(data):
-    with open(HOURS_FILE, "w") as f:
-        yaml.dump(data, f, sort_keys=True)
+    with open(HOURS_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
 
 
 def add_hours(data, day, ticket, hours):
-    if day not in data:
-        data[day] = {}
-    current_hours = data[day].get(ticket, 0)
-    data[day][ticket] = current_hours + hours
+    day_entries = data.setdefault(day, {})
+    day_entries[ticket] = day_entries.get(ticket, 0) + hours
     return data
 
 
-def print_day_log(day_iso, day_entries, common_label, short=False):
-    day_date = date.fromisoformat(day_iso)
-    day_str = day_date.strftime("%a %Y-%m-%d")
-
+def print_day_log(day_str, day_entries, common_label, tickets_info, short=False):
     # Sort: common_label first, then rest alphabetically
-    tickets = sorted(day_entries.keys(), key=lambda x: (x != common_label, x))
+    entries = sorted(day_entries.items(), key=lambda e: (e[0] != common_label, e[0]))
 
     day_total = sum(day_entries.values())
 
     if short:
-        entries = [f"{t}: {day_entries[t]:g}h" for t in tickets]
-        print(f"{day_str}: {day_total:g}h - {', '.join(entries)}")
+        summary = ", ".join(f"{key}: {hours:g}h" for key, hours in entries)
+        print(f"{day_str}: {day_total:g}h - {summary}")
         return day_total
 
-    print(f"\n--- Hours for {day_str} ---")
-
-    for key in tickets:
-        hours = day_entries[key]
-        ticket_info = load_ticket_from_cache(key)
+    # Collect the whole day and print it at once instead of line by line
+    lines = [f"\n--- Hours for {day_str} ---"]
+    for key, hours in entries:
+        ticket_info = tickets_info.get(key)
         if ticket_info:
-            print(f"{key}: {hours:g}h - {ticket_info.summary} [{ticket_info.status}]")
+            lines.append(
+                f"{key}: {hours:g}h - {ticket_info.summary} [{ticket_info.status}]"
+            )
         else:
-            print(f"{key}: {hours:g}h")
-    print(f"Day Total: {day_total:g}h")
+            lines.append(f"{key}: {hours:g}h")
+    lines.append(f"Day Total: {day_total:g}h")
+    print("\n".join(lines))
     return day_total
 
 
 def print_log(data, days, common_label, short=False):
     total_week = 0
+    # Resolve every ticket of the week from the cache once, not per day
+    all_keys = {key for day_iso in days for key in data.get(day_iso, {})}
+    tickets_info = {} if short else load_tickets_from_cache(all_keys)
+    any_printed = False
     for day_iso in days:
         day_entries = data.get(day_iso, {})
         if not day_entries:
             continue
 
-        total_week += print_day_log(day_iso, day_entries, common_label, short)
+        any_printed = True
+        day_str = date.fromisoformat(day_iso).strftime("%a %Y-%m-%d")
+        total_week += print_day_log(
+            day_str, day_entries, common_label, tickets_info, short
+        )
 
     if not short:
         if total_week > 0:
@@ -71,7 +88,7 @@ def print_log(data, days, common_label, short=False):
             print(f"Weekly Total: {total_week:g}h")
         else:
             print("\nNo hours tracked this week.")
-    elif not any(data.get(day) for day in days):
+    elif not any_printed:
         print("No hours tracked this week.")
 
 
@@ -108,5 +125,6 @@ def run_with_args(args, config):
 
     if args.log or args.short or not (args.add or args.total):
         start_of_week = today - timedelta(days=today.weekday())
-        week_days = [(start_of_week + timedelta(days=i)).isoformat() for i in range(7)]
+        base = start_of_week.toordinal()
+        week_days = [date.fromordinal(base + i).isoformat() for i in range(7)]
         print_log(data, week_days, config.common_label, short=args.short)
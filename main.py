@@ -2,12 +2,17 @@
 
 import argparse
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Callable, Collection
 
 from jira import JIRA
 
 import hours_command as hours
 import show_command as show
 from shared import (
+    Config,
     Ticket,
     JiraFields,
     load_config,
@@ -16,7 +21,9 @@ from shared import (
     CACHE_DIR,
     NO_SPRINT,
     get_cached_tickets,
+    get_jira,
     fetch_and_cache_tickets,
+    keys_jql,
 )
 from track_command import track_tickets
 
@@ -25,7 +32,7 @@ def print_tickets(title: str, tickets: list[Ticket], url: str) -> None:
     if not tickets:
         return
     print(f"\n{title}")
-    for issue in sorted(tickets, key=lambda x: x.key):
+    for issue in sorted(tickets, key=attrgetter("key")):
         link = f"{url}/browse/{issue.key}"
         points = issue.story_points
         points_str = f" ({points:g} SP)" if points else ""
@@ -33,19 +40,29 @@ def print_tickets(title: str, tickets: list[Ticket], url: str) -> None:
 
 
 def fetch_additional_tickets(
-    jira: JIRA, issues_data: list[Ticket], fields: JiraFields, jql: str, error_msg: str
+    jira: JIRA, fields: JiraFields, jql: str, error_msg: str
 ) -> list[Ticket]:
-    additional_tickets = []
     try:
-        my_issues_data = fetch_and_cache_tickets(jira, jql, fields)
-        for ticket in my_issues_data:
-            # Check if we already have it in issues_data (refreshed or cached)
-            existing = next((i for i in issues_data if i.key == ticket.key), None)
-            if not existing:
-                additional_tickets.append(ticket)
+        # Partial fetch, so no remote link lookups for tickets we only list
+        return fetch_and_cache_tickets(
+            jira, jql, fields, search_fields=fields.listing_fields()
+        )
     except Exception as e:
         print(f"{error_msg}: {e}")
-    return additional_tickets
+    return []
+
+
+def with_thread_client(config: Config, func: Callable, *args, **kwargs):
+    # Runs in a worker thread, which must not share the caller's Jira client
+    return func(get_jira(config), *args, **kwargs)
+
+
+def exclude_known_tickets(
+    tickets: list[Ticket], issues_data: list[Ticket]
+) -> list[Ticket]:
+    # Drop tickets we already have in issues_data (refreshed or cached)
+    known_keys = {i.key for i in issues_data}
+    return [t for t in tickets if t.key not in known_keys]
 
 
 def format_story_pints(closed: float, total: float) -> str:
@@ -55,54 +72,61 @@ def format_story_pints(closed: float, total: float) -> str:
         return f"{closed:g} / {total:g} SP"
 
 
-def print_sprint_story_points(sprint_name: str, closed: float, total: float) -> None:
-    print(f"{sprint_name}: {format_story_pints(closed, total)}")
+def format_sprint_story_points(sprint_name: str, closed: float, total: float) -> str:
+    return f"{sprint_name}: {format_story_pints(closed, total)}"
 
 
-def print_sprint_stats(issues_data: list[Ticket], closed_statuses: list[str]) -> None:
-    print("\n--- Story Points by Sprint ---")
-    sprint_stats = {}  # sprint_name -> {"total": points, "closed": points}
+def print_sprint_stats(
+    issues_data: list[Ticket], closed_statuses: Collection[str]
+) -> None:
+    sprint_stats = defaultdict(lambda: [0.0, 0.0])  # sprint_name -> [total, closed]
     for ticket in issues_data:
-        sprint_name = ticket.sprint
-        points = ticket.story_points
-        status = ticket.status
-
-        if sprint_name not in sprint_stats:
-            sprint_stats[sprint_name] = {"total": 0, "closed": 0}
-
-        sprint_stats[sprint_name]["total"] += points
-        if status in closed_statuses:
-            sprint_stats[sprint_name]["closed"] += points
-
-    for sprint, stats in sorted(sprint_stats.items()):
-        total = stats["total"]
-        closed = stats["closed"]
-        print_sprint_story_points(sprint, closed, total)
+        stats = sprint_stats[ticket.sprint]
+        stats[0] += ticket.story_points
+        if ticket.status in closed_statuses:
+            stats[1] += ticket.story_points
+
+    real_count = 0
+    real_total = real_closed = 0.0
+    excl_total = excl_closed = 0.0
+    lines = ["\n--- Story Points by Sprint ---"]
+    for sprint, (total, closed) in sorted(sprint_stats.items()):
+        lines.append(format_sprint_story_points(sprint, closed, total))
+        if sprint != NO_SPRINT:
+            # Sums before the current sprint are the ones excluding the last sprint
+            excl_total, excl_closed = real_total, real_closed
+            real_total += total
+            real_closed += closed
+            real_count += 1
 
     # 1. Average excluding last sprint
-    real_sprints = {k: v for k, v in sprint_stats.items() if k != NO_SPRINT}
-    if len(real_sprints) > 1:
-        sorted_keys = sorted(real_sprints.keys())
-        all_but_last = [real_sprints[s] for s in sorted_keys[:-1]]
-        avg_total_excl = sum(s["total"] for s in all_but_last) / len(all_but_last)
-        avg_closed_excl = sum(s["closed"] for s in all_but_last) / len(all_but_last)
-        print_sprint_story_points(
-            "Average sprint (excl. last)", avg_closed_excl, avg_total_excl
+    if real_count > 1:
+        lines.append(
+            format_sprint_story_points(
+                "Average sprint (excl. last)",
+                excl_closed / (real_count - 1),
+                excl_total / (real_count - 1),
+            )
         )
 
     # 2. Overall Average
-    if real_sprints:
-        avg_total = sum(s["total"] for s in real_sprints.values()) / len(real_sprints)
-        avg_closed = sum(s["closed"] for s in real_sprints.values()) / len(real_sprints)
-        print_sprint_story_points("Average sprint", avg_closed, avg_total)
+    if real_count:
+        lines.append(
+            format_sprint_story_points(
+                "Average sprint", real_closed / real_count, real_total / real_count
+            )
+        )
+
+    print("\n".join(lines))
 
     # 3. Average hours per story point
     hours_data = hours.load_hours()
+    issue_keys = {t.key for t in issues_data}
     total_hours = 0
     for day_entries in hours_data.values():
         for ticket_key, ticket_hours in day_entries.items():
             # Only count hours for tickets that have story points
-            if any(t.key == ticket_key for t in issues_data):
+            if ticket_key in issue_keys:
                 total_hours += ticket_hours
 
     total_points = sum(t.story_points for t in issues_data)
@@ -121,8 +145,8 @@ def main() -> None:
     )
     track_parser.add_argument(
         "ticket",
-        nargs="?",
-        help="Ticket ID to track",
+        nargs="*",
+        help="Ticket IDs to track",
     )
 
     # hours command
@@ -157,8 +181,7 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
+    os.makedirs(CACHE_DIR, exist_ok=True)
 
     config = load_config()
 
@@ -174,10 +197,8 @@ def main() -> None:
 
     validate_jira_full_config(config)
 
-    jira = JIRA(server=config.jira.url, token_auth=config.jira.token)
-
     if args.command == "track":
-        track_tickets(jira, config, args.ticket)
+        track_tickets(get_jira(config), config, args.ticket)
         return
 
     if not config.tickets:
@@ -189,33 +210,51 @@ def main() -> None:
         config.tickets, config.jira.closed_statuses
     )
 
-    jira = JIRA(server=config.jira.url, token_auth=config.jira.token)
-
-    if keys_to_fetch:
-        print(
-            f"Refreshing {len(keys_to_fetch)} ticket(s) from Jira: {', '.join(keys_to_fetch)}"
+    fields = config.jira.fields
+
+    # 2. Refresh stale tickets and fetch tickets assigned to me or authored by me.
+    # The searches are independent network round-trips, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        refreshed = None
+        if keys_to_fetch:
+            print(
+                f"Refreshing {len(keys_to_fetch)} ticket(s) from Jira: {', '.join(keys_to_fetch)}"
+            )
+            refreshed = executor.submit(
+                with_thread_client,
+                config,
+                fetch_and_cache_tickets,
+                keys_jql(keys_to_fetch),
+                fields,
+                limit=len(keys_to_fetch),
+                # Tickets deleted in Jira must not fail the whole refresh
+                validate_query=False,
+            )
+        assigned = executor.submit(
+            with_thread_client,
+            config,
+            fetch_additional_tickets,
+            fields,
+            config.jira.filter_jql(
+                "assignee = currentUser() AND statusCategory != Done"
+            ),
+            "Could not fetch assigned tickets",
         )
-        jql = f"key in ({','.join(keys_to_fetch)})"
-        fetched_data = fetch_and_cache_tickets(
-            jira, jql, config.jira.fields, limit=len(keys_to_fetch)
+        authored = executor.submit(
+            with_thread_client,
+            config,
+            fetch_additional_tickets,
+            fields,
+            config.jira.filter_jql(
+                "reporter = currentUser() AND statusCategory != Done"
+            ),
+            "Could not fetch authored tickets",
         )
-        issues_data.extend(fetched_data)
-
-    # 2. Fetch tickets assigned to me or authored by me
-    assigned_tickets = fetch_additional_tickets(
-        jira,
-        issues_data,
-        config.jira.fields,
-        config.jira.filter_jql("assignee = currentUser() AND statusCategory != Done"),
-        "Could not fetch assigned tickets",
-    )
-    authored_tickets = fetch_additional_tickets(
-        jira,
-        issues_data,
-        config.jira.fields,
-        config.jira.filter_jql("reporter = currentUser() AND statusCategory != Done"),
-        "Could not fetch authored tickets",
-    )
+
+    if refreshed:
+        issues_data.extend(refreshed.result())
+    assigned_tickets = exclude_known_tickets(assigned.result(), issues_data)
+    authored_tickets = exclude_known_tickets(authored.result(), issues_data)
 
     # Features:
     # 1. Show list of still open tickets
@@ -1,18 +1,31 @@
+import functools
+import hashlib
+import json
 import os
-import re
 import sys
-from dataclasses import dataclass, asdict
-from typing import Optional, Any
+import threading
+import time
+from dataclasses import dataclass
+from typing import Collection, Iterable, Iterator, Optional, Any
 
 import yaml
-from jira import JIRA
+from jira import JIRA, Issue
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 CONFIG_FILE = "config.yaml"
 CACHE_DIR = ".cache"
+TICKET_CACHE_FILE = os.path.join(CACHE_DIR, "tickets.json")
+QUERY_CACHE_FILE = os.path.join(CACHE_DIR, "queries.json")
 NO_SPRINT = "No Sprint"
+SEARCH_BATCH_SIZE = 500
+DEFAULT_CLOSED_STATUSES = frozenset({"Done", "Closed"})
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket:
     key: str
     summary: str
@@ -24,19 +37,37 @@ class Ticket:
     links: Optional[list[dict]] = None
 
 
-@dataclass
+_ticket_cache: Optional[dict[str, Ticket]] = None
+_ticket_cache_dirty = False
+_ticket_cache_lock = threading.RLock()
+
+
+@dataclass(slots=True)
 class JiraFields:
     story_points: Optional[str] = None
     sprint: Optional[str] = None
     acceptance_criteria: Optional[str] = None
 
+    def search_fields(self) -> list[str]:
+        # Only request the fields process_jira_issue actually reads
+        custom = [self.story_points, self.sprint, self.acceptance_criteria]
+        return ["summary", "status", "description", "issuelinks"] + [
+            field for field in custom if field
+        ]
+
+    def listing_fields(self) -> list[str]:
+        # One-line listings only show key, summary, status and story points
+        return ["summary", "status"] + (
+            [self.story_points] if self.story_points else []
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class JiraConfig:
     url: Optional[str] = None
     token: Optional[str] = None
     fields: Optional[JiraFields] = None
-    closed_statuses: list[str] = None
+    closed_statuses: frozenset[str] = DEFAULT_CLOSED_STATUSES
     filter: Optional[str] = None
 
     def filter_jql(self, jql: str) -> str:
@@ -45,17 +76,33 @@ class JiraConfig:
         return f"{jql} AND {self.filter}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     jira: JiraConfig
-    tickets: list[str]
+    # Insertion-ordered set of tracked keys, saved back as a plain list
+    tickets: dict[str, None]
     common_label: str
 
 
+_config_data_cache: dict[tuple[str, int, int], dict] = {}
+
+
+def _read_config_data() -> dict:
+    # Reuse the parsed YAML as long as the file has not been touched
+    global _config_data_cache
+    stat = os.stat(CONFIG_FILE)
+    cache_key = (CONFIG_FILE, stat.st_mtime_ns, stat.st_size)
+    data = _config_data_cache.get(cache_key)
+    if data is None:
+        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+        _config_data_cache = {cache_key: data}
+    return data
+
+
 def load_config() -> Config:
     try:
-        with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_config_data()
     except FileNotFoundError:
         print(f"{CONFIG_FILE} not found")
         sys.exit(1)
@@ -73,13 +120,16 @@ def load_config() -> Config:
         url=jira_data.get("url"),
         token=jira_data.get("token"),
         fields=fields,
-        closed_statuses=jira_data.get("closed_statuses", ["Done", "Closed"]),
+        closed_statuses=frozenset(
+            jira_data.get("closed_statuses", DEFAULT_CLOSED_STATUSES)
+        ),
         filter=jira_data.get("filter"),
     )
 
     return Config(
         jira=jira_config,
-        tickets=data.get("tickets", []),
+        # An empty "tickets:" entry in the YAML loads as None
+        tickets=dict.fromkeys(data.get("tickets") or ()),
         common_label=data.get("common_label", "common"),
     )
 
@@ -88,67 +138,78 @@ def save_config(config: Config) -> None:
     # We want to preserve the structure but update tickets
     # To preserve comments and formatting, we'd need a more sophisticated YAML library
     # but for now, we'll just rewrite it as per dataclass structure
+    # Optional settings are only written when set, so defaults stay implicit
+    fields_data = {
+        "story_points": config.jira.fields.story_points,
+        "sprint": config.jira.fields.sprint,
+    }
+    if config.jira.fields.acceptance_criteria:
+        fields_data["acceptance_criteria"] = config.jira.fields.acceptance_criteria
+    jira_data = {
+        "url": config.jira.url,
+        "token": config.jira.token,
+        "fields": fields_data,
+    }
+    if config.jira.closed_statuses != DEFAULT_CLOSED_STATUSES:
+        # Kept as a frozenset in memory, sort it for a stable file
+        jira_data["closed_statuses"] = sorted(config.jira.closed_statuses)
+    if config.jira.filter:
+        jira_data["filter"] = config.jira.filter
+
     data = {
-        "jira": {
-            "url": config.jira.url,
-            "token": config.jira.token,
-            "fields": {
-                "story_points": config.jira.fields.story_points,
-                "sprint": config.jira.fields.sprint,
-                "acceptance_criteria": config.jira.fields.acceptance_criteria,
-            },
-            "filter": config.jira.filter,
-        },
-        "tickets": config.tickets,
+        "jira": jira_data,
+        "tickets": list(config.tickets),
         "common_label": config.common_label,
     }
-    with open(CONFIG_FILE, "w") as f:
-        yaml.dump(data, f, sort_keys=False)
+    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+        yaml.dump(data, f, Dumper=SafeDumper, sort_keys=False)
+
+
+def keys_jql(keys: Iterable[str]) -> str:
+    # Quote every key so odd input can never change the meaning of the query
+    quoted = ('"' + key.replace("\\", "\\\\").replace('"', '\\"') + '"' for key in keys)
+    return f"key in ({','.join(quoted)})"
 
 
 def extract_sprint_name(issue: Any, fields: JiraFields) -> str:
     sprint_field = fields.sprint
-    if not sprint_field or not hasattr(issue.fields, sprint_field):
-        return NO_SPRINT
-
-    sprints = getattr(issue.fields, sprint_field)
-    if not sprints or not isinstance(sprints, list) or len(sprints) == 0:
+    sprints = getattr(issue.fields, sprint_field, None) if sprint_field else None
+    if not sprints or not isinstance(sprints, list):
         return NO_SPRINT
 
     sprint = sprints[-1]
-    if hasattr(sprint, "name"):
-        return sprint.name
+    name = getattr(sprint, "name", None)
+    if name is not None:
+        return name
     elif isinstance(sprint, str) and "name=" in sprint:
-        match = re.search(r"name=([^,]+)", sprint)
-        if match:
-            return match.group(1)
+        # GreenHopper string: "...Sprint@...[id=1,name=Sprint 3,goal=...]"
+        name = sprint.partition("name=")[2].partition(",")[0]
+        if name:
+            return name
     return str(sprint)
 
 
-def save_ticket_to_cache(ticket: Ticket) -> None:
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
-    cache_path = os.path.join(CACHE_DIR, f"{ticket.key}.yaml")
-    with open(cache_path, "w") as f:
-        yaml.dump(asdict(ticket), f)
+def save_ticket_to_cache(ticket: Ticket, replace: bool = True) -> None:
+    # Only updates the in-memory index, call flush_ticket_cache() to persist it
+    global _ticket_cache_dirty
+    with _ticket_cache_lock:
+        cache = _load_cache_index()
+        if not replace and ticket.key in cache:
+            return
+        cache[ticket.key] = ticket
+        _ticket_cache_dirty = True
 
 
 def process_jira_issue(
     issue: Any, fields: JiraFields, jira: Optional[JIRA] = None
 ) -> Ticket:
-    status = issue.fields.status.name
-    points = getattr(issue.fields, fields.story_points, 0)
-    if points is None:
-        points = 0
+    issue_fields = issue.fields
+    ac_field = fields.acceptance_criteria
 
-    description = (
-        issue.fields.description if hasattr(issue.fields, "description") else None
-    )
-    ac_raw = (
-        getattr(issue.fields, fields.acceptance_criteria, None)
-        if fields.acceptance_criteria
-        else None
-    )
+    status = issue_fields.status.name
+    points = getattr(issue_fields, fields.story_points, None) or 0
+    description = getattr(issue_fields, "description", None)
+    ac_raw = getattr(issue_fields, ac_field, None) if ac_field else None
 
     ac_processed = None
     if ac_raw:
@@ -175,28 +236,24 @@ def process_jira_issue(
             ac_processed = str(ac_raw)
 
     links = []
-    if hasattr(issue.fields, "issuelinks"):
-        for link in issue.fields.issuelinks:
-            if hasattr(link, "outwardIssue"):
-                links.append(
-                    {
-                        "type": link.type.outward,
-                        "key": link.outwardIssue.key,
-                        "summary": link.outwardIssue.fields.summary,
-                        "status": link.outwardIssue.fields.status.name,
-                        "url": link.outwardIssue.permalink(),
-                    }
-                )
-            elif hasattr(link, "inwardIssue"):
-                links.append(
-                    {
-                        "type": link.type.inward,
-                        "key": link.inwardIssue.key,
-                        "summary": link.inwardIssue.fields.summary,
-                        "status": link.inwardIssue.fields.status.name,
-                        "url": link.inwardIssue.permalink(),
-                    }
-                )
+    for link in getattr(issue_fields, "issuelinks", None) or []:
+        linked = getattr(link, "outwardIssue", None)
+        if linked is not None:
+            link_type = link.type.outward
+        else:
+            linked = getattr(link, "inwardIssue", None)
+            if linked is None:
+                continue
+            link_type = link.type.inward
+        links.append(
+            {
+                "type": link_type,
+                "key": linked.key,
+                "summary": linked.fields.summary,
+                "status": linked.fields.status.name,
+                "url": linked.permalink(),
+            }
+        )
 
     if jira:
         try:
@@ -204,11 +261,7 @@ def process_jira_issue(
             for rl in remote_links:
                 links.append(
                     {
-                        "type": (
-                            rl.relationship
-                            if hasattr(rl, "relationship")
-                            else "links to"
-                        ),
+                        "type": getattr(rl, "relationship", "links to"),
                         "key": "Remote",
                         "summary": rl.object.title,
                         "status": "External",
@@ -220,7 +273,7 @@ def process_jira_issue(
 
     return Ticket(
         key=issue.key,
-        summary=issue.fields.summary,
+        summary=issue_fields.summary,
         status=status,
         story_points=float(points),
         sprint=extract_sprint_name(issue, fields),
@@ -230,59 +283,196 @@ def process_jira_issue(
     )
 
 
+def iter_tickets(
+    jira: JIRA,
+    jql: str,
+    fields: JiraFields,
+    limit: int = 0,
+    search_fields: Optional[list[str]] = None,
+    validate_query: bool = True,
+) -> Iterator[Ticket]:
+    # A limit of 0 makes the client fetch all matching issues in batches
+    fetched_issues = jira.search_issues(
+        jql,
+        maxResults=limit,
+        validate_query=validate_query,
+        fields=search_fields or fields.search_fields(),
+    )
+    # Remote links are only worth a request per issue for complete tickets
+    links_jira = jira if search_fields is None else None
+    for i, issue in enumerate(fetched_issues):
+        # Release the raw issue as soon as it has been converted
+        fetched_issues[i] = None
+        yield process_jira_issue(issue, fields, jira=links_jira)
+
+
 def fetch_and_cache_tickets(
-    jira: JIRA, jql: str, fields: JiraFields, limit: int = 50
+    jira: JIRA,
+    jql: str,
+    fields: JiraFields,
+    limit: int = 0,
+    search_fields: Optional[list[str]] = None,
+    ttl: int = 0,
+    validate_query: bool = True,
+    cache_scope: str = "",
 ) -> list[Ticket]:
-    fetched_issues = jira.search_issues(jql, maxResults=limit)
+    if ttl:
+        fields_key = ",".join(search_fields or fields.search_fields())
+        query_key = f"{cache_scope} {jql} [{fields_key}]"
+        cached = load_query_from_cache(query_key)
+        if cached is not None:
+            return cached
+
+    # Partial tickets only fill gaps, they must not replace complete ones
+    complete = search_fields is None
     processed_tickets = []
-
-    for issue in fetched_issues:
-        issue_info = process_jira_issue(issue, fields, jira=jira)
+    for issue_info in iter_tickets(
+        jira, jql, fields, limit, search_fields, validate_query
+    ):
         processed_tickets.append(issue_info)
-        save_ticket_to_cache(issue_info)
+        save_ticket_to_cache(issue_info, replace=complete)
 
+    flush_ticket_cache()
+    if ttl:
+        save_query_to_cache(query_key, processed_tickets, ttl)
     return processed_tickets
 
 
-def load_ticket_from_cache(key: str) -> Optional[Ticket]:
-    cache_path = os.path.join(CACHE_DIR, f"{key}.yaml")
-    if not os.path.exists(cache_path):
+def query_cache_scope(config: Config) -> str:
+    # currentUser() results belong to one server and account, only a digest
+    # of the token is stored so the cache never holds the credential itself
+    token = (config.jira.token or "").encode("utf-8")
+    return f"{config.jira.url}#{hashlib.sha256(token).hexdigest()[:16]}"
+
+
+def _load_query_cache() -> dict[str, dict]:
+    try:
+        with open(QUERY_CACHE_FILE, "r", encoding="utf-8") as f:
+            queries = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return queries if isinstance(queries, dict) else {}
+
+
+def _query_expired(entry: Any, now: float) -> bool:
+    return not isinstance(entry, dict) or entry.get("expires", 0) <= now
+
+
+def load_query_from_cache(query_key: str) -> Optional[list[Ticket]]:
+    entry = _load_query_cache().get(query_key)
+    if _query_expired(entry, time.time()):
         return None
     try:
-        with open(cache_path, "r") as f:
-            data = yaml.safe_load(f)
-            if data:
-                return Ticket(**data)
-    except Exception as e:
-        print(f"Error loading cache for {key}: {e}")
-        # Optionally delete the corrupted cache file
-        try:
-            os.remove(cache_path)
-        except:
-            pass
-    return None
+        return [Ticket(**data) for data in entry["tickets"]]
+    except (KeyError, TypeError):
+        # Anything unexpected in the file is a miss, not an error
+        return None
+
+
+def save_query_to_cache(query_key: str, tickets: list[Ticket], ttl: int) -> None:
+    now = time.time()
+    queries = {
+        key: entry
+        for key, entry in _load_query_cache().items()
+        if not _query_expired(entry, now)
+    }
+    queries[query_key] = {
+        "expires": now + ttl,
+        "tickets": [_ticket_to_dict(t) for t in tickets],
+    }
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(QUERY_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(queries, f)
+
+
+def _load_cache_index() -> dict[str, Ticket]:
+    # All cached tickets live in a single JSON file which is read once per run
+    global _ticket_cache
+    # Tickets may be fetched from several threads, make sure we only read once
+    with _ticket_cache_lock:
+        if _ticket_cache is None:
+            _ticket_cache = {}
+            try:
+                with open(TICKET_CACHE_FILE, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                _ticket_cache = {key: Ticket(**value) for key, value in data.items()}
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Error loading ticket cache: {e}")
+    return _ticket_cache
+
+
+def _ticket_to_dict(ticket: Ticket) -> dict[str, Any]:
+    # A shallow dict is all json needs, asdict() would deep-copy links and criteria
+    return {
+        "key": ticket.key,
+        "summary": ticket.summary,
+        "status": ticket.status,
+        "story_points": ticket.story_points,
+        "sprint": ticket.sprint,
+        "description": ticket.description,
+        "acceptance_criteria": ticket.acceptance_criteria,
+        "links": ticket.links,
+    }
+
+
+def flush_ticket_cache() -> None:
+    global _ticket_cache_dirty
+    with _ticket_cache_lock:
+        if not _ticket_cache_dirty:
+            return
+        data = {key: _ticket_to_dict(t) for key, t in _ticket_cache.items()}
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(TICKET_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        _ticket_cache_dirty = False
+
+
+def load_ticket_from_cache(key: str) -> Optional[Ticket]:
+    return _load_cache_index().get(key)
+
 
+def load_tickets_from_cache(keys: Iterable[str]) -> dict[str, Ticket]:
+    cache = _load_cache_index()
+    return {key: cache[key] for key in keys if key in cache}
 
-def is_cache_fresh(ticket: Optional[Ticket], closed_statuses: list[str]) -> bool:
+
+def is_cache_fresh(ticket: Optional[Ticket], closed_statuses: Collection[str]) -> bool:
     if ticket is None:
         return False
     return ticket.status in closed_statuses
 
 
 def get_cached_tickets(
-    ticket_keys: list[str], closed_statuses: list[str]
+    ticket_keys: Iterable[str], closed_statuses: Collection[str]
 ) -> tuple[list[Ticket], list[str]]:
-    cached_issues = []
-    keys_to_fetch = []
+    tickets = [(key, load_ticket_from_cache(key)) for key in ticket_keys]
+    # Inlined is_cache_fresh: only closed tickets are served from the cache
+    cached_issues = [
+        t for _, t in tickets if t is not None and t.status in closed_statuses
+    ]
+    keys_to_fetch = [
+        key for key, t in tickets if t is None or t.status not in closed_statuses
+    ]
+    return cached_issues, keys_to_fetch
 
-    for key in ticket_keys:
-        ticket = load_ticket_from_cache(key)
-        if is_cache_fresh(ticket, closed_statuses):
-            cached_issues.append(ticket)
-        else:
-            keys_to_fetch.append(key)
 
-    return cached_issues, keys_to_fetch
+@functools.cache
+def _connect_jira(url: str, token: str, thread_id: int) -> JIRA:
+    # Large pages keep the number of search round-trips low
+    return JIRA(
+        server=url,
+        token_auth=token,
+        default_batch_sizes={Issue: SEARCH_BATCH_SIZE},
+    )
+
+
+def get_jira(config: Config) -> JIRA:
+    # Connecting bootstraps a session, so reuse one client per server and token.
+    # requests.Session is not guaranteed to be thread-safe, so each thread gets
+    # its own client.
+    return _connect_jira(config.jira.url, config.jira.token, threading.get_ident())
 
 
 def validate_jira_base_config(config: Config) -> None:
@@ -1,12 +1,19 @@
 from jira import JIRA
-from shared import Config, process_jira_issue, save_ticket_to_cache
+from shared import (
+    Config,
+    flush_ticket_cache,
+    get_jira,
+    process_jira_issue,
+    save_ticket_to_cache,
+)
 
 
 def show_story(jira: JIRA, config: Config, key: str) -> None:
     try:
-        issue = jira.issue(key)
+        issue = jira.issue(key, fields=",".join(config.jira.fields.search_fields()))
         ticket = process_jira_issue(issue, config.jira.fields, jira=jira)
         save_ticket_to_cache(ticket)
+        flush_ticket_cache()
 
         print(f"# {ticket.key}: {ticket.summary}\n")
 
@@ -52,7 +59,4 @@ def show_story(jira: JIRA, config: Config, key: str) -> None:
 
 
 def run_with_args(args, config: Config) -> None:
-    from jira import JIRA
-
-    jira = JIRA(server=config.jira.url, token_auth=config.jira.token)
-    show_story(jira, config, args.ticket)
+    show_story(get_jira(config), config, args.ticket)
@@ -7,6 +7,7 @@ from hours_command import (
     print_log,
     print_ticket_total,
 )
+from shared import SafeDumper
 
 
 def test_print_ticket_total_no_cache(capsys, monkeypatch):
@@ -67,6 +68,14 @@ def test_print_log_empty(capsys):
     assert "No hours tracked this week." in captured.out
 
 
+def test_print_log_short_empty(capsys):
+    days = ["2026-01-08", "2026-01-09"]
+    data = {"2026-01-08": {}}
+    print_log(data, days, "common", short=True)
+    captured = capsys.readouterr()
+    assert captured.out == "No hours tracked this week.\n"
+
+
 def test_print_log_with_data(capsys):
     days = ["2026-01-08", "2026-01-09"]
     data = {
@@ -100,6 +109,33 @@ def test_print_log_with_data(capsys):
     assert lines_09[2].strip().startswith("Z-TICKET:")
 
 
+def test_print_log_with_cache(capsys, monkeypatch):
+    days = ["2026-01-08", "2026-01-09"]
+    data = {
+        "2026-01-08": {"PROJ-123": 2.0},
+        "2026-01-09": {"PROJ-123": 1.0},
+    }
+
+    class MockTicket:
+        summary = "Test Summary"
+        status = "In Progress"
+
+    calls = []
+
+    def load_tickets(keys):
+        calls.append(set(keys))
+        return {"PROJ-123": MockTicket()}
+
+    monkeypatch.setattr("hours_command.load_tickets_from_cache", load_tickets)
+
+    print_log(data, days, "common")
+    captured = capsys.readouterr()
+
+    assert captured.out.count("PROJ-123: 2h - Test Summary [In Progress]") == 1
+    assert captured.out.count("PROJ-123: 1h - Test Summary [In Progress]") == 1
+    assert calls == [{"PROJ-123"}]
+
+
 def test_print_log_short(capsys):
     days = ["2026-01-08", "2026-01-09"]
     data = {
@@ -155,7 +191,7 @@ def test_add_hours_different_ticket_same_day():
 
 def test_save_and_load_hours(tmp_path, monkeypatch):
     # Use a temporary file for testing
-    hours_file = tmp_path / "test_hours.yaml"
+    hours_file = tmp_path / "test_hours.json"
     monkeypatch.setattr("hours_command.HOURS_FILE", str(hours_file))
 
     data = {"2026-01-09": {"common": 5.0}}
@@ -168,13 +204,33 @@ def test_save_and_load_hours(tmp_path, monkeypatch):
 
 
 def test_load_hours_non_existent(tmp_path, monkeypatch):
-    hours_file = tmp_path / "non_existent.yaml"
+    hours_file = tmp_path / "non_existent.json"
+    legacy_file = tmp_path / "non_existent.yaml"
     monkeypatch.setattr("hours_command.HOURS_FILE", str(hours_file))
+    monkeypatch.setattr("hours_command.LEGACY_HOURS_FILE", str(legacy_file))
 
     loaded_data = load_hours()
     assert loaded_data == {}
 
 
+def test_load_hours_legacy_yaml(tmp_path, monkeypatch):
+    hours_file = tmp_path / "hours.json"
+    legacy_file = tmp_path / "hours.yaml"
+    monkeypatch.setattr("hours_command.HOURS_FILE", str(hours_file))
+    monkeypatch.setattr("hours_command.LEGACY_HOURS_FILE", str(legacy_file))
+
+    data = {"2026-01-09": {"common": 5.0}}
+    with open(legacy_file, "w") as f:
+        yaml.dump(data, f, Dumper=SafeDumper)
+
+    assert load_hours() == data
+
+    # The next save migrates the data to the new file
+    save_hours(add_hours(load_hours(), "2026-01-09", "common", 1.0))
+    assert hours_file.exists()
+    assert load_hours() == {"2026-01-09": {"common": 6.0}}
+
+
 def test_load_config_permissive(tmp_path, monkeypatch):
     from shared import load_config
 
@@ -185,12 +241,12 @@ def test_load_config_permissive(tmp_path, monkeypatch):
         "tickets": ["T-1"],
     }
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=SafeDumper)
 
     monkeypatch.setattr("shared.CONFIG_FILE", str(config_file))
 
     config = load_config()
     assert config.common_label == "Testing"
-    assert config.tickets == ["T-1"]
+    assert list(config.tickets) == ["T-1"]
     assert config.jira.url is None
     assert config.jira.fields.story_points is None
@@ -1,9 +1,16 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
+from jira import Issue
 
 from main import (
+    exclude_known_tickets,
+    fetch_additional_tickets,
     print_sprint_stats,
 )
 from shared import (
@@ -13,10 +20,23 @@ from shared import (
     is_cache_fresh,
     get_cached_tickets,
     process_jira_issue,
+    fetch_and_cache_tickets,
+    iter_tickets,
+    query_cache_scope,
+    save_query_to_cache,
+    keys_jql,
     NO_SPRINT,
+    SEARCH_BATCH_SIZE,
+    SafeDumper,
+    SafeLoader,
     load_config,
     save_config,
+    save_ticket_to_cache,
+    load_ticket_from_cache,
+    flush_ticket_cache,
     validate_jira_full_config,
+    get_jira,
+    _connect_jira,
     Config,
     JiraConfig,
 )
@@ -31,7 +51,7 @@ def test_track_tickets_by_key(capsys):
             token="token",
             fields=JiraFields(story_points="sp", sprint="sprint"),
         ),
-        tickets=["T-1"],
+        tickets=dict.fromkeys(["T-1"]),
         common_label="BMW",
     )
 
@@ -42,7 +62,7 @@ def test_track_tickets_by_key(capsys):
         patch("track_command.save_config") as mock_save,
     ):
         mock_fetch.return_value = [ticket_to_add]
-        track_tickets(jira_mock, config, "T-2")
+        track_tickets(jira_mock, config, ["T-2"])
 
     assert "T-2" in config.tickets
     captured = capsys.readouterr()
@@ -54,11 +74,11 @@ def test_track_tickets_by_key_already_tracked(capsys):
     jira_mock = MagicMock()
     config = Config(
         jira=JiraConfig(fields=JiraFields()),
-        tickets=["T-1"],
+        tickets=dict.fromkeys(["T-1"]),
         common_label="BMW",
     )
 
-    track_tickets(jira_mock, config, "T-1")
+    track_tickets(jira_mock, config, ["T-1"])
 
     captured = capsys.readouterr()
     assert "T-1 is already being tracked." in captured.out
@@ -66,11 +86,61 @@ def test_track_tickets_by_key_already_tracked(capsys):
     assert len(config.tickets) == 1
 
 
+def test_track_tickets_by_multiple_keys(capsys):
+    jira_mock = MagicMock()
+    config = Config(
+        jira=JiraConfig(fields=JiraFields()),
+        tickets=dict.fromkeys(["T-1"]),
+        common_label="BMW",
+    )
+
+    with (
+        patch("track_command.fetch_and_cache_tickets") as mock_fetch,
+        patch("track_command.save_config") as mock_save,
+    ):
+        mock_fetch.return_value = [Ticket("T-2", "New Issue", "Open", 2.0, "S1")]
+        track_tickets(jira_mock, config, ["T-1", "T-2", "T-3"])
+
+    # Only untracked keys are looked up, with a single search
+    mock_fetch.assert_called_once()
+    assert mock_fetch.call_args.args[1] == 'key in ("T-2","T-3")'
+    assert mock_fetch.call_args.kwargs["validate_query"] is False
+    assert list(config.tickets) == ["T-1", "T-2"]
+    captured = capsys.readouterr()
+    assert "T-1 is already being tracked." in captured.out
+    assert "Ticket T-3 not found in Jira." in captured.out
+    assert "Added T-2 to tracking." in captured.out
+    mock_save.assert_called_once()
+
+
+def test_track_tickets_invalid_key(capsys):
+    jira_mock = MagicMock()
+    config = Config(
+        jira=JiraConfig(fields=JiraFields()),
+        tickets=dict.fromkeys(["T-1"]),
+        common_label="BMW",
+    )
+
+    with (
+        patch("track_command.fetch_and_cache_tickets") as mock_fetch,
+        patch("track_command.save_config") as mock_save,
+    ):
+        mock_fetch.return_value = [Ticket("T-2", "New Issue", "Open", 2.0, "S1")]
+        track_tickets(jira_mock, config, [" t-2 ", "T-2 OR 1=1", "T2"])
+
+    assert mock_fetch.call_args.args[1] == 'key in ("T-2")'
+    assert list(config.tickets) == ["T-1", "T-2"]
+    captured = capsys.readouterr()
+    assert "Invalid key format: 'T-2 OR 1=1'" in captured.out
+    assert "Invalid key format: 'T2'" in captured.out
+    mock_save.assert_called_once()
+
+
 def test_track_tickets_no_new(capsys):
     jira_mock = MagicMock()
     config = Config(
         jira=JiraConfig(fields=JiraFields()),
-        tickets=["T-1"],
+        tickets=dict.fromkeys(["T-1"]),
         common_label="BMW",
     )
 
@@ -79,6 +149,9 @@ def test_track_tickets_no_new(capsys):
         mock_fetch.return_value = [Ticket("T-1", "Summary", "Open", 1.0, "S1")]
         track_tickets(jira_mock, config)
 
+    assert mock_fetch.call_args.kwargs["search_fields"] == ["summary", "status"]
+    assert mock_fetch.call_args.kwargs["ttl"] > 0
+
     captured = capsys.readouterr()
     assert "No new untracked tickets found assigned to you." in captured.out
 
@@ -91,7 +164,7 @@ def test_track_tickets_add_all(monkeypatch, capsys):
             token="token",
             fields=JiraFields(story_points="sp", sprint="sprint"),
         ),
-        tickets=["T-1"],
+        tickets=dict.fromkeys(["T-1"]),
         common_label="BMW",
     )
 
@@ -106,11 +179,93 @@ def test_track_tickets_add_all(monkeypatch, capsys):
         track_tickets(jira_mock, config)
 
     assert "T-2" in config.tickets
+    assert mock_fetch.call_args.kwargs["search_fields"] == ["summary", "status", "sp"]
     captured = capsys.readouterr()
     assert "Added T-2 to tracking." in captured.out
     mock_save.assert_called_once()
 
 
+def test_get_jira_reuses_client():
+    config = Config(
+        jira=JiraConfig(url="https://test.jira.com", token="token"),
+        tickets={},
+        common_label="BMW",
+    )
+
+    _connect_jira.cache_clear()
+    try:
+        with patch("shared.JIRA") as mock_jira:
+            first = get_jira(config)
+            second = get_jira(config)
+            # Worker threads must not share the session of the main thread
+            mock_jira.side_effect = lambda **kwargs: MagicMock()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                other = executor.submit(get_jira, config).result()
+    finally:
+        # Don't leak the mocked client into later tests
+        _connect_jira.cache_clear()
+
+    assert first is second
+    assert other is not first
+    assert mock_jira.call_count == 2
+    mock_jira.assert_any_call(
+        server="https://test.jira.com",
+        token_auth="token",
+        default_batch_sizes={Issue: SEARCH_BATCH_SIZE},
+    )
+
+
+def test_track_tickets_partial_selection(capsys):
+    jira_mock = MagicMock()
+    config = Config(
+        jira=JiraConfig(fields=JiraFields()),
+        tickets=dict.fromkeys(["T-1"]),
+        common_label="BMW",
+    )
+
+    untracked = [
+        Ticket("T-2", "New Issue", "Open", 2.0, "S1"),
+        Ticket("T-3", "Other Issue", "Open", 1.0, "S1"),
+    ]
+
+    with (
+        patch("track_command.fetch_and_cache_tickets", return_value=untracked),
+        patch("builtins.input", return_value=" 1, x,5 ,"),
+        patch("track_command.save_config") as mock_save,
+    ):
+        track_tickets(jira_mock, config)
+
+    assert list(config.tickets) == ["T-1", "T-3"]
+    captured = capsys.readouterr()
+    assert "Invalid input: 'x'" in captured.out
+    assert "Invalid index: 5" in captured.out
+    assert "Added T-3 to tracking." in captured.out
+    mock_save.assert_called_once()
+
+
+def test_track_tickets_selection_embedded_space(capsys):
+    jira_mock = MagicMock()
+    config = Config(
+        jira=JiraConfig(fields=JiraFields()),
+        tickets=dict.fromkeys(["T-1"]),
+        common_label="BMW",
+    )
+
+    untracked = [Ticket(f"T-{i}", "Issue", "Open", 1.0, "S1") for i in range(2, 22)]
+
+    with (
+        patch("track_command.fetch_and_cache_tickets", return_value=untracked),
+        patch("builtins.input", return_value="1 2"),
+        patch("track_command.save_config") as mock_save,
+    ):
+        track_tickets(jira_mock, config)
+
+    # "1 2" must not be read as index 12
+    assert list(config.tickets) == ["T-1"]
+    assert "Invalid input: '1 2'" in capsys.readouterr().out
+    mock_save.assert_not_called()
+
+
 def test_save_config(tmp_path, monkeypatch):
     config_file = tmp_path / "config_save.yaml"
     monkeypatch.setattr("shared.CONFIG_FILE", str(config_file))
@@ -120,8 +275,9 @@ def test_save_config(tmp_path, monkeypatch):
             url="https://test.jira.com",
             token="test-token",
             fields=JiraFields(story_points="sp_field", sprint="sprint_field"),
+            closed_statuses=frozenset({"Done", "Resolved"}),
         ),
-        tickets=["T-1", "T-2"],
+        tickets=dict.fromkeys(["T-1", "T-2"]),
         common_label="BMW",
     )
 
@@ -129,15 +285,38 @@ def test_save_config(tmp_path, monkeypatch):
 
     assert config_file.exists()
     with open(config_file, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
 
     assert data["jira"]["url"] == "https://test.jira.com"
     assert data["jira"]["token"] == "test-token"
     assert data["jira"]["fields"]["story_points"] == "sp_field"
+    assert data["jira"]["closed_statuses"] == ["Done", "Resolved"]
     assert data["tickets"] == ["T-1", "T-2"]
     assert data["common_label"] == "BMW"
 
 
+def test_save_config_omits_defaults(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    monkeypatch.setattr("shared.CONFIG_FILE", str(config_file))
+    with open(config_file, "w") as f:
+        yaml.dump(
+            {
+                "jira": {"url": "https://test.jira.com", "token": "t", "fields": {}},
+                "tickets": ["T-1"],
+            },
+            f,
+            Dumper=SafeDumper,
+        )
+
+    save_config(load_config())
+
+    with open(config_file, "r") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    assert "closed_statuses" not in data["jira"]
+    assert "filter" not in data["jira"]
+    assert "acceptance_criteria" not in data["jira"]["fields"]
+
+
 def test_load_config_missing_fields(tmp_path, monkeypatch):
     config_file = tmp_path / "config.yaml"
     config_data = {
@@ -152,7 +331,7 @@ def test_load_config_missing_fields(tmp_path, monkeypatch):
         "tickets": [],
     }
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=SafeDumper)
 
     monkeypatch.setattr("shared.CONFIG_FILE", str(config_file))
 
@@ -173,14 +352,42 @@ def test_load_config_success(tmp_path, monkeypatch):
         "tickets": ["T-1"],
     }
     with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
+        yaml.dump(config_data, f, Dumper=SafeDumper)
 
     monkeypatch.setattr("shared.CONFIG_FILE", str(config_file))
 
     config = load_config()
     assert config.jira.fields.story_points == "customfield_123"
     assert config.jira.fields.sprint == "customfield_456"
-    assert config.tickets == ["T-1"]
+    assert config.jira.closed_statuses == frozenset({"Done", "Closed"})
+    assert list(config.tickets) == ["T-1"]
+
+
+def test_load_config_empty_tickets(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("common_label: Testing\ntickets:\n")
+    monkeypatch.setattr("shared.CONFIG_FILE", str(config_file))
+
+    config = load_config()
+    assert config.tickets == {}
+    assert config.common_label == "Testing"
+
+
+def test_load_config_reparses_changed_file(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    monkeypatch.setattr("shared.CONFIG_FILE", str(config_file))
+
+    with open(config_file, "w") as f:
+        yaml.dump({"tickets": ["T-1"]}, f, Dumper=SafeDumper)
+    config = load_config()
+    config.tickets["T-2"] = None
+
+    # Mutating a loaded config must not leak into the next load
+    assert list(load_config().tickets) == ["T-1"]
+
+    with open(config_file, "w") as f:
+        yaml.dump({"tickets": ["T-1", "T-3"]}, f, Dumper=SafeDumper)
+    assert list(load_config().tickets) == ["T-1", "T-3"]
 
 
 def test_extract_sprint_name():
@@ -217,6 +424,19 @@ def test_extract_sprint_name():
     ]
     assert extract_sprint_name(issue_str_sprint, fields) == "Sprint 3"
 
+    # Mock issue with string sprint representation without a name
+    issue_str_no_name = MagicMock()
+    issue_str_no_name.fields.customfield_102 = ["Sprint@...[id=1,name=,goal=...]"]
+    assert (
+        extract_sprint_name(issue_str_no_name, fields)
+        == "Sprint@...[id=1,name=,goal=...]"
+    )
+
+
+def test_keys_jql():
+    assert keys_jql(["A-1", "B-2"]) == 'key in ("A-1","B-2")'
+    assert keys_jql(['A-1" OR key != "X']) == 'key in ("A-1\\" OR key != \\"X")'
+
 
 def test_is_cache_fresh():
     closed_statuses = ["Done", "Closed"]
@@ -292,6 +512,185 @@ def test_get_cached_tickets(mock_load):
     assert to_fetch == ["B", "C"]
 
 
+def test_ticket_cache_roundtrip(tmp_path, monkeypatch):
+    cache_file = tmp_path / "tickets.json"
+    monkeypatch.setattr("shared.CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("shared.TICKET_CACHE_FILE", str(cache_file))
+    monkeypatch.setattr("shared._ticket_cache", None)
+
+    ticket = Ticket("A", "S", "Done", 1.0, "S1", links=[{"key": "B"}])
+    save_ticket_to_cache(ticket)
+    flush_ticket_cache()
+
+    assert cache_file.exists()
+
+    # Force a re-read from disk
+    monkeypatch.setattr("shared._ticket_cache", None)
+    assert load_ticket_from_cache("A") == ticket
+    assert load_ticket_from_cache("B") is None
+
+
+def test_ticket_cache_partial_does_not_replace(tmp_path, monkeypatch):
+    monkeypatch.setattr("shared.CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("shared.TICKET_CACHE_FILE", str(tmp_path / "tickets.json"))
+    monkeypatch.setattr("shared._ticket_cache", None)
+
+    full = Ticket("A", "S", "Open", 1.0, "S1", description="Details")
+    save_ticket_to_cache(full)
+    save_ticket_to_cache(Ticket("A", "S", "Open", 1.0, NO_SPRINT), replace=False)
+    partial = Ticket("B", "Listed", "Open", 0.0, NO_SPRINT)
+    save_ticket_to_cache(partial, replace=False)
+
+    assert load_ticket_from_cache("A") == full
+    assert load_ticket_from_cache("B") == partial
+
+
+def test_search_fields():
+    fields = JiraFields(story_points="customfield_101", sprint="customfield_102")
+
+    assert fields.search_fields() == [
+        "summary",
+        "status",
+        "description",
+        "issuelinks",
+        "customfield_101",
+        "customfield_102",
+    ]
+
+
+@patch("shared.flush_ticket_cache")
+@patch("shared.save_ticket_to_cache")
+def test_fetch_and_cache_tickets_requests_fields(mock_save, mock_flush):
+    fields = JiraFields(story_points="customfield_101", sprint="customfield_102")
+    jira_mock = MagicMock()
+    jira_mock.search_issues.return_value = []
+
+    assert fetch_and_cache_tickets(jira_mock, "key = A", fields) == []
+
+    jira_mock.search_issues.assert_called_once_with(
+        "key = A", maxResults=0, validate_query=True, fields=fields.search_fields()
+    )
+    mock_flush.assert_called_once()
+
+
+@patch("shared.process_jira_issue")
+def test_iter_tickets_releases_raw_issues(mock_process):
+    raw_issues = [MagicMock(), MagicMock()]
+    jira_mock = MagicMock()
+    jira_mock.search_issues.return_value = raw_issues
+    mock_process.side_effect = lambda issue, fields, jira=None: issue
+
+    tickets = iter_tickets(jira_mock, "jql", JiraFields())
+    assert next(tickets) is not None
+    assert raw_issues[0] is None
+    assert raw_issues[1] is not None
+    assert len(list(tickets)) == 1
+    assert raw_issues == [None, None]
+
+
+@patch("shared.flush_ticket_cache")
+@patch("shared.save_ticket_to_cache")
+@patch("shared.process_jira_issue")
+def test_fetch_and_cache_tickets_partial_fields(mock_process, mock_save, mock_flush):
+    fields = JiraFields(story_points="customfield_101", sprint="customfield_102")
+    jira_mock = MagicMock()
+    jira_mock.search_issues.return_value = [MagicMock()]
+
+    tickets = fetch_and_cache_tickets(
+        jira_mock, "jql", fields, search_fields=["summary", "status"]
+    )
+
+    assert tickets == [mock_process.return_value]
+    jira_mock.search_issues.assert_called_once_with(
+        "jql", maxResults=0, validate_query=True, fields=["summary", "status"]
+    )
+    # No remote link lookups, and partial tickets never replace cached ones
+    assert mock_process.call_args.kwargs["jira"] is None
+    mock_save.assert_called_once_with(mock_process.return_value, replace=False)
+    mock_flush.assert_called_once()
+
+
+@patch("shared.iter_tickets")
+def test_fetch_and_cache_tickets_ttl(mock_iter, tmp_path, monkeypatch):
+    monkeypatch.setattr("shared.CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("shared.QUERY_CACHE_FILE", str(tmp_path / "queries.json"))
+    monkeypatch.setattr("shared.TICKET_CACHE_FILE", str(tmp_path / "tickets.json"))
+    monkeypatch.setattr("shared._ticket_cache", None)
+    ticket = Ticket("A", "S", "Open", 1.0, "S1")
+    mock_iter.side_effect = lambda *args: iter([ticket])
+    fields = JiraFields()
+
+    first = fetch_and_cache_tickets(
+        MagicMock(), "jql", fields, search_fields=["summary"], ttl=60
+    )
+    second = fetch_and_cache_tickets(
+        MagicMock(), "jql", fields, search_fields=["summary"], ttl=60
+    )
+
+    assert first == second == [ticket]
+    mock_iter.assert_called_once()
+
+    # Expired entries are fetched again
+    with patch("shared.time.time", return_value=time.time() + 61):
+        fetch_and_cache_tickets(
+            MagicMock(), "jql", fields, search_fields=["summary"], ttl=60
+        )
+    assert mock_iter.call_count == 2
+
+    # Another server or account never sees this result
+    fetch_and_cache_tickets(
+        MagicMock(),
+        "jql",
+        fields,
+        search_fields=["summary"],
+        ttl=60,
+        cache_scope="other",
+    )
+    assert mock_iter.call_count == 3
+
+
+@patch("shared.iter_tickets")
+def test_fetch_and_cache_tickets_ttl_bad_cache(mock_iter, tmp_path, monkeypatch):
+    query_file = tmp_path / "queries.json"
+    monkeypatch.setattr("shared.CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("shared.QUERY_CACHE_FILE", str(query_file))
+    monkeypatch.setattr("shared.TICKET_CACHE_FILE", str(tmp_path / "tickets.json"))
+    monkeypatch.setattr("shared._ticket_cache", None)
+    ticket = Ticket("A", "S", "Open", 1.0, "S1")
+    mock_iter.side_effect = lambda *args: iter([ticket])
+
+    for content in ["[1, 2]", '{" jql [summary]": {"expires": 1e20}}']:
+        query_file.write_text(content)
+        tickets = fetch_and_cache_tickets(
+            MagicMock(), "jql", JiraFields(), search_fields=["summary"], ttl=60
+        )
+        assert tickets == [ticket]
+    assert mock_iter.call_count == 2
+
+
+def test_save_query_to_cache_prunes_expired(tmp_path, monkeypatch):
+    query_file = tmp_path / "queries.json"
+    monkeypatch.setattr("shared.CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("shared.QUERY_CACHE_FILE", str(query_file))
+    query_file.write_text('{"old": {"expires": 1, "tickets": []}}')
+
+    save_query_to_cache("new", [], 60)
+
+    assert list(json.loads(query_file.read_text())) == ["new"]
+
+
+def test_query_cache_scope():
+    def scope(url, token):
+        return query_cache_scope(
+            Config(jira=JiraConfig(url=url, token=token), tickets={}, common_label="")
+        )
+
+    assert scope("https://a", "t1") == scope("https://a", "t1")
+    assert scope("https://a", "t1") != scope("https://a", "t2")
+    assert scope("https://a", "t1") != scope("https://b", "t1")
+    assert "t1" not in scope("https://a", "t1")
+
+
 def test_process_jira_issue():
     fields = JiraFields(story_points="customfield_101", sprint="customfield_102")
 
@@ -313,6 +712,59 @@ def test_process_jira_issue():
     assert ticket.sprint == "Sprint 1"
 
 
+def test_process_jira_issue_links():
+    fields = JiraFields(story_points="customfield_101", sprint="customfield_102")
+
+    def linked_issue(key):
+        return SimpleNamespace(
+            key=key,
+            fields=SimpleNamespace(
+                summary=f"{key} summary", status=SimpleNamespace(name="Open")
+            ),
+            permalink=lambda: f"https://jira/browse/{key}",
+        )
+
+    issue = SimpleNamespace(
+        key="PROJ-3",
+        fields=SimpleNamespace(
+            summary="Links",
+            status=SimpleNamespace(name="Open"),
+            issuelinks=[
+                SimpleNamespace(
+                    type=SimpleNamespace(outward="blocks"),
+                    outwardIssue=linked_issue("PROJ-4"),
+                ),
+                SimpleNamespace(
+                    type=SimpleNamespace(inward="is blocked by"),
+                    inwardIssue=linked_issue("PROJ-5"),
+                ),
+            ],
+        ),
+    )
+
+    ticket = process_jira_issue(issue, fields)
+
+    assert ticket.story_points == 0.0
+    assert ticket.description is None
+    assert ticket.sprint == NO_SPRINT
+    assert ticket.links == [
+        {
+            "type": "blocks",
+            "key": "PROJ-4",
+            "summary": "PROJ-4 summary",
+            "status": "Open",
+            "url": "https://jira/browse/PROJ-4",
+        },
+        {
+            "type": "is blocked by",
+            "key": "PROJ-5",
+            "summary": "PROJ-5 summary",
+            "status": "Open",
+            "url": "https://jira/browse/PROJ-5",
+        },
+    ]
+
+
 def test_process_jira_issue_null_points():
     fields = JiraFields(story_points="customfield_101", sprint="customfield_102")
 
@@ -374,3 +826,30 @@ def test_print_sprint_stats_no_real_sprints(capsys):
     assert "Average sprint:" not in output
     assert "Average hours per story point: 0.00h/SP" in output
     assert f"{NO_SPRINT}: 1 SP" in output
+
+
+def test_exclude_known_tickets():
+    known = Ticket("A", "S", "Open", 1.0, "S1")
+    new = Ticket("B", "S", "Open", 2.0, "S1")
+
+    assert exclude_known_tickets([known, new], [known]) == [new]
+
+
+def test_fetch_additional_tickets_listing_fields():
+    fields = JiraFields(story_points="customfield_101", sprint="customfield_102")
+    with patch("main.fetch_and_cache_tickets", return_value=[]) as mock_fetch:
+        assert fetch_additional_tickets(MagicMock(), fields, "jql", "Failed") == []
+
+    assert mock_fetch.call_args.kwargs["search_fields"] == [
+        "summary",
+        "status",
+        "customfield_101",
+    ]
+
+
+def test_fetch_additional_tickets_error(capsys):
+    with patch("main.fetch_and_cache_tickets", side_effect=Exception("boom")):
+        tickets = fetch_additional_tickets(MagicMock(), JiraFields(), "jql", "Failed")
+
+    assert tickets == []
+    assert "Failed: boom" in capsys.readouterr().out
@@ -1,31 +1,54 @@
-from typing import Any, Optional
+import re
+from typing import Any, Iterable, Optional
 
 from jira import JIRA
 
-from shared import fetch_and_cache_tickets, save_config, CONFIG_FILE, Ticket
+from shared import (
+    fetch_and_cache_tickets,
+    keys_jql,
+    query_cache_scope,
+    save_config,
+    CONFIG_FILE,
+)
 
+LISTING_CACHE_TTL = 120  # seconds, makes repeated track runs skip Jira
+_KEY_RE = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
 
-def track_tickets(jira: JIRA, config: Any, ticket_key: Optional[str] = None) -> None:
-    if ticket_key:
-        __track_single_ticket(jira, config, ticket_key)
+
+def track_tickets(
+    jira: JIRA, config: Any, ticket_keys: Optional[list[str]] = None
+) -> None:
+    if ticket_keys:
+        __track_keys(jira, config, ticket_keys)
         return
 
     print("Fetching open tickets assigned to you...")
+    # The listing only shows a few fields, so skip all the others
     my_open_tickets = fetch_and_cache_tickets(
         jira,
         config.jira.filter_jql("assignee = currentUser() AND statusCategory != Done"),
         config.jira.fields,
+        search_fields=config.jira.fields.listing_fields(),
+        ttl=LISTING_CACHE_TTL,
+        cache_scope=query_cache_scope(config),
     )
 
-    untracked = [t for t in my_open_tickets if t.key not in config.tickets]
+    # Filter and format in one pass, only the keys are needed for the selection
+    untracked = []
+    lines = []
+    for ticket in my_open_tickets:
+        if ticket.key not in config.tickets:
+            lines.append(
+                f"[{len(untracked)}] {ticket.key}: {ticket.summary} ({ticket.status})"
+            )
+            untracked.append(ticket.key)
 
     if not untracked:
         print("No new untracked tickets found assigned to you.")
         return
 
     print("\nUntracked tickets assigned to you:")
-    for i, ticket in enumerate(untracked):
-        print(f"[{i}] {ticket.key}: {ticket.summary} ({ticket.status})")
+    print("\n".join(lines))
 
     try:
         selection = input(
@@ -42,16 +65,21 @@ def track_tickets(jira: JIRA, config: Any, ticket_key: Optional[str] = None) ->
     if selection.strip().lower() == "all":
         selected_tickets = untracked
     else:
-        try:
-            indices = [int(x.strip()) for x in selection.split(",")]
-            for idx in indices:
-                if 0 <= idx < len(untracked):
-                    selected_tickets.append(untracked[idx])
-                else:
-                    print(f"Invalid index: {idx}")
-        except ValueError:
-            print("Invalid input. Please enter numbers or 'all'.")
-            return
+        # Skip invalid entries instead of discarding the whole selection
+        indices = []
+        for token in selection.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            try:
+                indices.append(int(token))
+            except ValueError:
+                print(f"Invalid input: {token!r}. Please enter numbers or 'all'.")
+        n = len(untracked)
+        selected_tickets = [untracked[idx] for idx in indices if 0 <= idx < n]
+        invalid = [str(idx) for idx in indices if not 0 <= idx < n]
+        if invalid:
+            print(f"Invalid index: {', '.join(invalid)}")
 
     if not selected_tickets:
         print("No valid tickets selected.")
@@ -62,31 +90,40 @@ def track_tickets(jira: JIRA, config: Any, ticket_key: Optional[str] = None) ->
     print(f"Updated {CONFIG_FILE}")
 
 
-def __track_single_ticket(jira: JIRA, config: Any, ticket_key: str):
-    if ticket_key in config.tickets:
-        print(f"{ticket_key} is already being tracked.")
+def __track_keys(jira: JIRA, config: Any, ticket_keys: list[str]):
+    keys = []
+    for ticket_key in dict.fromkeys(k.strip().upper() for k in ticket_keys):
+        # Reject malformed keys before spending a round-trip to Jira on them
+        if not _KEY_RE.match(ticket_key):
+            print(f"Invalid key format: {ticket_key!r}")
+        elif ticket_key in config.tickets:
+            print(f"{ticket_key} is already being tracked.")
+        else:
+            keys.append(ticket_key)
+    if not keys:
         return
 
     try:
-        jql = f"key = {ticket_key}"
-        tickets = fetch_and_cache_tickets(jira, jql, config.jira.fields)
+        # Look up all new keys with a single search. Without validation Jira
+        # skips unknown keys instead of rejecting the whole query.
+        tickets = fetch_and_cache_tickets(
+            jira, keys_jql(keys), config.jira.fields, validate_query=False
+        )
+        found_keys = {ticket.key for ticket in tickets}
+        for ticket_key in keys:
+            if ticket_key not in found_keys:
+                print(f"Ticket {ticket_key} not found in Jira.")
         if not tickets:
-            print(f"Ticket {ticket_key} not found in Jira.")
             return
-        __add_tickets(config, [ticket_key])
+        __add_tickets(config, tickets)
         save_config(config)
     except Exception as e:
-        print(f"Error fetching ticket {ticket_key}: {e}")
+        print(f"Error fetching tickets {', '.join(keys)}: {e}")
 
 
-def __add_tickets(config, selected_tickets: list[Ticket] | list[str]):
-    if not selected_tickets:
-        return
-    if isinstance(selected_tickets[0], Ticket):
-        selected_ticket_keys = [ticket.key for ticket in selected_tickets]
-    else:
-        selected_ticket_keys = selected_tickets
-    for ticket in selected_ticket_keys:
+def __add_tickets(config, selected_tickets: Iterable[Any]):
+    # Accepts Ticket objects or plain keys
+    for ticket in (getattr(t, "key", t) for t in selected_tickets):
         if ticket not in config.tickets:
-            config.tickets.append(ticket)
+            config.tickets[ticket] = None
             print(f"Added {ticket} to tracking.")